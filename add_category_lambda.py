@@ -1,7 +1,13 @@
 import json
 import boto3
 import os
+import logging
 from botocore.exceptions import ClientError
+from item_cache import item_cache
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
 
 # Initialize DynamoDB client
 dynamodb = boto3.resource('dynamodb')
@@ -76,13 +82,11 @@ def lambda_handler(event, context):
             # Check if parent category exists
             parent_category = category
             try:
-                response = table.get_item(
-                    Key={
-                        'category': parent_category,
-                        'subcategory': parent_category
-                    }
-                )
-                if 'Item' not in response:
+                parent_item = item_cache.get_item(table, {
+                    'category': parent_category,
+                    'subcategory': parent_category
+                })
+                if parent_item is None:
                     return build_bedrock_response(False, f"Parent category '{parent_category}' does not exist")
             except ClientError as e:
                 return build_bedrock_response(False, f"Error checking parent category: {str(e)}")
@@ -96,6 +100,8 @@ def lambda_handler(event, context):
             
             # Check if subcategory already exists
             try:
+                # Always read the table here: a cached answer can only cause
+                # a false rejection or an overwrite
                 response = table.get_item(
                     Key={
                         'category': category,
@@ -120,6 +126,7 @@ def lambda_handler(event, context):
             
             # Check if category already exists
             try:
+                # Always read the table for duplicate checks
                 response = table.get_item(
                     Key={
                         'category': category,
@@ -141,7 +148,12 @@ def lambda_handler(event, context):
         
         # Write to DynamoDB
         try:
-            table.put_item(Item=item)
+            if item['subcategory'] == item['category']:
+                # Main categories are the parents looked up above, so keep
+                # their cache entry current
+                item_cache.put_item(table, item)
+            else:
+                table.put_item(Item=item)
             
             # Return success response
             if 'subcategory' in param_dict and param_dict['subcategory']:
@@ -156,6 +168,8 @@ def lambda_handler(event, context):
             
     except Exception as e:
         return build_bedrock_response(False, f"Unexpected error: {str(e)}")
+    finally:
+        logger.info(f"Item cache stats: {json.dumps(item_cache.stats())}")
 
 def build_bedrock_response(success, message, data=None):
     """
@@ -0,0 +1,117 @@
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+def _env_number(name, default, cast, minimum):
+    """Read a numeric setting, falling back to the default on a bad value"""
+    try:
+        value = cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    if not math.isfinite(value):
+        value = default
+    return max(value, minimum)
+
+# Cache settings, overridable through Lambda environment variables.
+# Each Lambda container has its own cache and never sees other containers'
+# writes, so entries are kept only briefly.
+MAX_ITEMS = _env_number('ITEM_CACHE_MAX_ITEMS', 1024, int, 1)
+# Staleness window: a category deleted by another Lambda can still be
+# reported as present for up to this many seconds
+TTL_SECONDS = _env_number('ITEM_CACHE_TTL_SECONDS', 10, float, 0)
+NEGATIVE_TTL_SECONDS = _env_number('ITEM_CACHE_NEGATIVE_TTL_SECONDS', 5, float, 0)
+
+class ItemCache:
+    """
+    Bounded LRU read-through cache for single-key DynamoDB lookups.
+
+    Lives at module level so it survives across warm invocations of the same
+    Lambda container. Missing items are cached too ("negative" entries) but
+    with a shorter TTL, since another container may create them at any
+    time. Puts made through this cache update it directly (write-through),
+    so the container always sees its own writes.
+
+    Writes made by other containers, including the delete Lambda, are never
+    seen: a cached item can outlive its deletion by up to the positive TTL.
+
+    Items are copied on the way in and out, so callers may mutate what they
+    get back without affecting the cache.
+    """
+
+    def __init__(self, max_items=MAX_ITEMS, ttl=TTL_SECONDS, negative_ttl=NEGATIVE_TTL_SECONDS):
+        self.max_items = max(max_items, 1)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(table, key):
+        return (table.name, tuple(sorted(key.items())))
+
+    def _store(self, cache_key, item):
+        if item is not None:
+            item = dict(item)
+            ttl = self.ttl
+        else:
+            ttl = self.negative_ttl
+        with self._lock:
+            self._entries[cache_key] = (item, time.monotonic() + ttl)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+
+    def get_item(self, table, key):
+        """
+        Return the item stored under key, or None if it does not exist.
+        ClientError from DynamoDB is propagated and nothing is cached.
+        """
+        cache_key = self._cache_key(table, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                item, expires_at = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(cache_key)
+                    self.hits += 1
+                    return dict(item) if item is not None else None
+                del self._entries[cache_key]
+            self.misses += 1
+
+        response = table.get_item(Key=key)
+        item = response.get('Item')
+        self._store(cache_key, item)
+        return dict(item) if item is not None else None
+
+    def put_item(self, table, item, key_names=('category', 'subcategory')):
+        """Write item to the table and refresh its cache entry"""
+        table.put_item(Item=item)
+        key = {name: item[name] for name in key_names}
+        self._store(self._cache_key(table, key), item)
+
+    def invalidate(self, table=None, key=None):
+        """Drop a single entry, or the whole cache when no key is given"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._cache_key(table, key), None)
+
+    def stats(self):
+        """Return hit/miss counters and current size for tuning"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'max_items': self.max_items
+            }
+
+# Shared instance used by the add category Lambda function
+item_cache = ItemCache()
@@ -0,0 +1,76 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from item_cache import ItemCache
+from test_item_cache import FakeTable
+
+try:
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    import add_category_lambda
+except ImportError:
+    add_category_lambda = None
+
+def add_event(category, subcategory=None):
+    parameters = [
+        {'name': 'category', 'type': 'string', 'value': category},
+        {'name': 'description', 'type': 'string', 'value': f'{subcategory or category} items'}
+    ]
+    if subcategory:
+        parameters.append({'name': 'subcategory', 'type': 'string', 'value': subcategory})
+    return {'messageVersion': '1.0', 'apiPath': '/addcategory', 'parameters': parameters}
+
+def succeeded(response):
+    return json.loads(response['response']['responseBody']['application/json'])['success']
+
+@unittest.skipIf(add_category_lambda is None, 'boto3 is not installed')
+class AddCategoryHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = FakeTable()
+        self.cache = ItemCache(ttl=60, negative_ttl=60)
+        patchers = [
+            mock.patch.object(add_category_lambda, 'table', self.table),
+            mock.patch.object(add_category_lambda, 'item_cache', self.cache)
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def add(self, category, subcategory=None):
+        return succeeded(add_category_lambda.lambda_handler(add_event(category, subcategory), None))
+
+    def test_parent_fetched_once_for_many_children(self):
+        self.assertTrue(self.add('electronics'))
+        for i in range(50):
+            self.assertTrue(self.add('electronics', f'child{i}'))
+
+        parent_reads = self.table.get_keys.count(('electronics', 'electronics'))
+        # One duplicate check when the main category is added; the parent
+        # check for every child is served from the cache
+        self.assertEqual(parent_reads, 1)
+        self.assertEqual(self.cache.stats()['hits'], 50)
+
+    def test_duplicate_checks_always_read_table(self):
+        self.assertTrue(self.add('electronics'))
+        self.assertTrue(self.add('electronics', 'mobiles'))
+        self.assertFalse(self.add('electronics', 'mobiles'))
+        self.assertEqual(self.table.get_keys.count(('electronics', 'mobiles')), 2)
+
+        # A child removed behind the cache's back can be added again
+        self.table.delete_item(Key={'category': 'electronics', 'subcategory': 'mobiles'})
+        self.assertTrue(self.add('electronics', 'mobiles'))
+
+    def test_subcategory_writes_not_cached(self):
+        self.assertTrue(self.add('electronics'))
+        self.assertTrue(self.add('electronics', 'mobiles'))
+        self.assertEqual(self.cache.stats()['size'], 1)
+
+    def test_main_category_clears_cached_missing_parent(self):
+        self.assertFalse(self.add('electronics', 'mobiles'))
+        self.assertTrue(self.add('electronics'))
+        self.assertTrue(self.add('electronics', 'mobiles'))
+
+if __name__ == '__main__':
+    unittest.main()
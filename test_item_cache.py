@@ -0,0 +1,182 @@
+import os
+import time
+import unittest
+from unittest import mock
+
+import item_cache
+from item_cache import ItemCache
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    ClientError = None
+
+class FakeTable:
+    """Minimal in-memory stand-in for a DynamoDB Table resource"""
+
+    name = 'ProductCategories'
+
+    def __init__(self, error=None):
+        self.items = {}
+        self.get_calls = 0
+        self.get_keys = []
+        self.error = error
+
+    @staticmethod
+    def _key(key):
+        return (key['category'], key['subcategory'])
+
+    def get_item(self, Key):
+        self.get_calls += 1
+        self.get_keys.append(self._key(Key))
+        if self.error is not None:
+            raise self.error
+        item = self.items.get(self._key(Key))
+        return {'Item': item} if item is not None else {}
+
+    def put_item(self, Item):
+        self.items[self._key(Item)] = Item
+
+    def delete_item(self, Key):
+        self.items.pop(self._key(Key), None)
+
+def key(category, subcategory=None):
+    return {'category': category, 'subcategory': subcategory or category}
+
+class ItemCacheTest(unittest.TestCase):
+
+    def test_read_through_hit(self):
+        table = FakeTable()
+        table.put_item(dict(key('electronics'), level=1))
+        cache = ItemCache()
+        for _ in range(50):
+            self.assertEqual(cache.get_item(table, key('electronics'))['level'], 1)
+        self.assertEqual(table.get_calls, 1)
+        self.assertEqual(cache.stats()['hits'], 49)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_evicts_least_recently_used(self):
+        table = FakeTable()
+        cache = ItemCache(max_items=2)
+        cache.get_item(table, key('a'))
+        cache.get_item(table, key('b'))
+        cache.get_item(table, key('a'))  # 'b' is now least recently used
+        cache.get_item(table, key('c'))
+        self.assertEqual(cache.stats()['size'], 2)
+
+        calls = table.get_calls
+        cache.get_item(table, key('a'))
+        self.assertEqual(table.get_calls, calls)
+        cache.get_item(table, key('b'))
+        self.assertEqual(table.get_calls, calls + 1)
+
+    def test_max_items_clamped_to_one(self):
+        cache = ItemCache(max_items=0)
+        table = FakeTable()
+        cache.get_item(table, key('a'))
+        cache.get_item(table, key('a'))
+        self.assertEqual(table.get_calls, 1)
+
+    def test_negative_entry_expires(self):
+        table = FakeTable()
+        cache = ItemCache(negative_ttl=0.05)
+        self.assertIsNone(cache.get_item(table, key('electronics')))
+
+        table.put_item(dict(key('electronics'), level=1))
+        self.assertIsNone(cache.get_item(table, key('electronics')))
+
+        time.sleep(0.06)
+        self.assertIsNotNone(cache.get_item(table, key('electronics')))
+        self.assertEqual(table.get_calls, 2)
+
+    def test_put_writes_through(self):
+        table = FakeTable()
+        cache = ItemCache()
+        self.assertIsNone(cache.get_item(table, key('electronics')))
+        cache.put_item(table, dict(key('electronics'), level=1))
+        self.assertEqual(cache.get_item(table, key('electronics'))['level'], 1)
+        self.assertEqual(table.get_calls, 1)
+
+    def test_put_replaces_negative_entry(self):
+        table = FakeTable()
+        cache = ItemCache(negative_ttl=60)
+        self.assertIsNone(cache.get_item(table, key('electronics')))
+        cache.put_item(table, dict(key('electronics'), level=1))
+        self.assertIsNotNone(cache.get_item(table, key('electronics')))
+        self.assertEqual(table.get_calls, 1)
+
+    def test_invalidate_forces_reload(self):
+        table = FakeTable()
+        cache = ItemCache()
+        cache.get_item(table, key('electronics'))
+        cache.invalidate(table, key('electronics'))
+        cache.get_item(table, key('electronics'))
+        self.assertEqual(table.get_calls, 2)
+
+    def test_returned_items_are_copies(self):
+        table = FakeTable()
+        cache = ItemCache()
+        item = dict(key('electronics'), level=1)
+        cache.put_item(table, item)
+        item['level'] = 99
+        returned = cache.get_item(table, key('electronics'))
+        returned['description'] = 'changed'
+        self.assertEqual(cache.get_item(table, key('electronics')), dict(key('electronics'), level=1))
+
+    def test_lookup_error_caches_nothing(self):
+        table = FakeTable(error=RuntimeError('throttled'))
+        cache = ItemCache()
+        with self.assertRaises(RuntimeError):
+            cache.get_item(table, key('electronics'))
+        self.assertEqual(cache.stats()['size'], 0)
+
+    @unittest.skipIf(ClientError is None, 'botocore is not installed')
+    def test_client_error_caches_nothing(self):
+        error = ClientError({'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'throttled'}}, 'GetItem')
+        table = FakeTable(error=error)
+        cache = ItemCache()
+        with self.assertRaises(ClientError):
+            cache.get_item(table, key('electronics'))
+        self.assertEqual(cache.stats()['size'], 0)
+
+        table.error = None
+        cache.get_item(table, key('electronics'))
+        self.assertEqual(table.get_calls, 2)
+
+    def test_stats(self):
+        table = FakeTable()
+        cache = ItemCache(max_items=8)
+        self.assertEqual(cache.stats()['hit_rate'], 0.0)
+        cache.get_item(table, key('a'))
+        cache.get_item(table, key('a'))
+        cache.get_item(table, key('a'))
+        cache.get_item(table, key('b'))
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['hit_rate'], 0.5)
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['max_items'], 8)
+
+class EnvSettingsTest(unittest.TestCase):
+
+    def test_bad_values_fall_back_to_defaults(self):
+        env = {
+            'ITEM_CACHE_MAX_ITEMS': 'lots',
+            'ITEM_CACHE_TTL_SECONDS': '',
+            'ITEM_CACHE_NEGATIVE_TTL_SECONDS': '-3'
+        }
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(item_cache._env_number('ITEM_CACHE_MAX_ITEMS', 1024, int, 1), 1024)
+            self.assertEqual(item_cache._env_number('ITEM_CACHE_TTL_SECONDS', 10, float, 0), 10)
+            self.assertEqual(item_cache._env_number('ITEM_CACHE_NEGATIVE_TTL_SECONDS', 5, float, 0), 0)
+        with mock.patch.dict(os.environ, {'ITEM_CACHE_MAX_ITEMS': '0'}):
+            self.assertEqual(item_cache._env_number('ITEM_CACHE_MAX_ITEMS', 1024, int, 1), 1)
+
+    def test_non_finite_values_fall_back_to_defaults(self):
+        for value in ('nan', 'inf', '-inf'):
+            with mock.patch.dict(os.environ, {'ITEM_CACHE_TTL_SECONDS': value}):
+                self.assertEqual(item_cache._env_number('ITEM_CACHE_TTL_SECONDS', 10, float, 0), 10)
+
+if __name__ == '__main__':
+    unittest.main()